@@ -6,6 +6,9 @@ Stores save events over time and learns patterns from observation.
 
 import json
 import os
+import threading
+import time
+from bisect import bisect_right
 from datetime import datetime
 from typing import Optional, List
 from collections import Counter
@@ -13,8 +16,30 @@ from dataclasses import dataclass, asdict
 
 from snapshot import SaveEvent, Snapshot, load_snapshot, create_save_event
 
+# orjson is optional; it's a faster drop-in for the history file
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes: compact by default, 2-space indented if pretty."""
+    if orjson is not None:
+        # NON_STR_KEYS: stringify non-str keys (e.g. a None activity) like json does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, default=str).encode()
+    return json.dumps(obj, separators=(',', ':'), default=str).encode()
+
+
+def _loads(data):
+    """Parse JSON from bytes or str."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+@dataclass(slots=True, frozen=True)
 class SessionSummary:
     """Summary of a play session."""
     start_time: str
@@ -31,78 +56,308 @@ class SessionSummary:
 class SaveHistory:
     """
     Persistent storage for save events and pattern learning.
+
+    New events are appended to a JSONL log next to the history file and
+    folded back into the history file every `compact_every` events (or on
+    close()), so each save costs one line of I/O instead of a full rewrite.
+    Each compaction bumps a generation number stored in the history file;
+    the log's first line records the generation it extends, so a log left
+    behind by an interrupted compaction is recognised and not replayed twice.
+    Appends are batched: events added within `flush_interval` seconds of the
+    last flush are written together by a background timer.
     """
 
-    def __init__(self, history_file: str = 'save_history.json', max_events: int = 100):
+    # Saves further apart than this start a new play session
+    SESSION_GAP_SECONDS = 1800  # 30 minutes
+
+    def __init__(self, history_file: str = 'save_history.json', max_events: int = 100,
+                 compact_every: int = 20, flush_interval: float = 5.0):
         self.history_file = history_file
+        self.log_file = os.path.splitext(history_file)[0] + '.jsonl'
         self.max_events = max_events
+        self.compact_every = compact_every
+        self.flush_interval = flush_interval
         self.events: List[dict] = []
+        # Parsed epoch of each event's timestamp, parallel to self.events;
+        # None where the timestamp is missing or malformed
+        self._ts: List[Optional[float]] = []
         self.patterns: dict = {}
+        self._uncompacted = 0
+        # Compaction generation of the history file on disk
+        self._generation = 0
+        # Whether load() found a log already compacted into the history file,
+        # and whether this instance has tidied the log before its first append
+        self._log_stale = False
+        self._log_prepared = False
+        # Events added but not yet written to the log
+        self._pending: List[dict] = []
+        self._dirty = False
+        self._last_flush = 0.0
+        self._flush_timer: Optional[threading.Timer] = None
+        # Guards state shared with the flush timer thread
+        self._lock = threading.RLock()
+        self._reset_aggregates()
         self.load()
 
+    def _reset_aggregates(self):
+        """Clear the running aggregates that back the learned patterns."""
+        self._autosave_sum = 0.0
+        self._autosave_n = 0
+        self._manual_sum = 0.0
+        self._manual_n = 0
+        self._activity_counter: Counter = Counter()
+        self._event_type_counter: Counter = Counter()
+        # Indices i where events[i] starts a new session (sorted ascending)
+        self._break_indices: List[int] = []
+
+    def _accumulate(self, event: dict, sign: int = 1):
+        """Add (sign=1) or remove (sign=-1) one save event's contribution to the aggregates."""
+        interval = event.get('time_since_last', 0)
+        if interval > 0:
+            if event.get('save_type') == 'autosave':
+                self._autosave_sum += sign * interval
+                self._autosave_n += sign
+            elif event.get('save_type') == 'manual':
+                self._manual_sum += sign * interval
+                self._manual_n += sign
+
+        self._activity_counter[event.get('inferred_activity', 'unknown')] += sign
+        for e in event.get('events', []):
+            self._event_type_counter[e.get('type', 'unknown')] += sign
+
+    def _track_break(self, i: int):
+        """
+        Record a session break if events[i] follows the previous event by more
+        than the session gap. Events without a usable timestamp are skipped.
+        """
+        ts = self._ts[i]
+        if ts is None:
+            return
+        j = i - 1
+        while j >= 0 and self._ts[j] is None:
+            j -= 1
+        if j >= 0 and ts - self._ts[j] > self.SESSION_GAP_SECONDS:
+            self._break_indices.append(i)
+
     def load(self):
         """Load history from file."""
+        self._reset_aggregates()
+        # Generation the log must extend to be replayed; None accepts any log,
+        # for when there is no history file to have compacted it into
+        expected_generation = None
         if os.path.exists(self.history_file):
             try:
-                with open(self.history_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.history_file, 'rb') as f:
+                    data = _loads(f.read())
                     self.events = data.get('events', [])
                     self.patterns = data.get('patterns', {})
+                    self._generation = data.get('log_generation', 0)
+                    expected_generation = self._generation
             except Exception as e:
                 print(f"Warning: Could not load history: {e}")
                 self.events = []
                 self.patterns = {}
 
-    def save(self):
-        """Save history to file."""
-        # Trim to max_events
-        if len(self.events) > self.max_events:
-            self.events = self.events[-self.max_events:]
+        # Replay events appended since the last compaction
+        replayed = self._read_log(expected_generation)
+        self.events.extend(replayed)
+        self._uncompacted = len(replayed)
+
+        self._ts = [self._parse_ts(event) for event in self.events]
+        for i, event in enumerate(self.events):
+            self._accumulate(event)
+            self._track_break(i)
+        self._trim()
+        if replayed:
+            self._update_patterns()
+
+    @staticmethod
+    def _parse_ts(event: dict) -> Optional[float]:
+        """The event's timestamp as a float epoch, or None if it can't be parsed."""
+        try:
+            return datetime.fromisoformat(event['timestamp']).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _read_log(self, expected_generation: Optional[int] = None) -> List[dict]:
+        """
+        Read events from the append-only log without modifying it.
+        A torn final line (a crash mid-append, or an append still in
+        progress) is ignored. A log from an older generation was already
+        compacted into the history file, so it isn't replayed; it's marked
+        stale for _prepare_log to delete before this instance writes.
+        """
+        self._log_stale = False
+        if not os.path.exists(self.log_file):
+            return []
+        try:
+            with open(self.log_file, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            print(f"Warning: Could not read history log: {e}")
+            return []
+
+        lines = data[:data.rfind(b'\n') + 1].splitlines()
+        generation = 0  # Logs written before generations were tracked have no header
+        if lines:
+            try:
+                header = _loads(lines[0])
+            except ValueError:
+                header = None
+            if isinstance(header, dict) and 'log_generation' in header:
+                generation = header['log_generation']
+                lines = lines[1:]
+
+        if expected_generation is not None and generation != expected_generation:
+            self._log_stale = True
+            return []
+
+        events = []
+        for line in lines:
+            try:
+                events.append(_loads(line))
+            except ValueError:
+                pass
+        return events
 
-        with open(self.history_file, 'w') as f:
-            json.dump({
+    def _prepare_log(self):
+        """
+        Before this instance first appends: delete a stale log left by an
+        interrupted compaction, or cut a torn final line off a live one so the
+        next append starts on a fresh line. Only writers touch the log.
+        """
+        self._log_prepared = True
+        try:
+            if self._log_stale:
+                self._log_stale = False
+                os.remove(self.log_file)
+                return
+            with open(self.log_file, 'r+b') as f:
+                data = f.read()
+                end = data.rfind(b'\n') + 1
+                if end < len(data):
+                    print("Warning: Dropping torn final line from history log")
+                    f.truncate(end)
+        except FileNotFoundError:
+            pass
+
+    def _append_log(self, events: List[dict]):
+        """Append events to the JSONL log in a single write, starting it with a generation header."""
+        if not self._log_prepared:
+            self._prepare_log()
+        with open(self.log_file, 'ab') as f:
+            header = _dumps({'log_generation': self._generation}) + b'\n' if f.tell() == 0 else b''
+            f.write(header + b''.join(_dumps(e) + b'\n' for e in events))
+
+    def _trim(self):
+        """Trim to max_events, dropping the trimmed events from the aggregates."""
+        if len(self.events) > self.max_events:
+            dropped = len(self.events) - self.max_events
+            for event in self.events[:dropped]:
+                self._accumulate(event, -1)
+            self.events = self.events[dropped:]
+            self._ts = self._ts[dropped:]
+            # Shift surviving breaks; one landing on index 0 no longer separates anything
+            k = bisect_right(self._break_indices, dropped)
+            self._break_indices = [i - dropped for i in self._break_indices[k:]]
+
+    def save(self, pretty: bool = False):
+        """
+        Write the full history file and truncate the append-only log.
+        Output is compact JSON unless pretty=True (for human-readable exports).
+        """
+        with self._lock:
+            self._cancel_flush_timer()
+            self._trim()
+
+            # The new generation marks the current log as compacted, even if
+            # we crash before removing it below
+            generation = self._generation + 1
+            payload = _dumps({
                 'events': self.events,
                 'patterns': self.patterns,
                 'last_updated': datetime.now().isoformat(),
-            }, f, indent=2, default=str)
+                'log_generation': generation,
+            }, pretty=pretty)
+
+            tmp_path = self.history_file + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.history_file)
+            self._generation = generation
+
+            if os.path.exists(self.log_file):
+                os.remove(self.log_file)
+            self._log_stale = False
+            self._uncompacted = 0
+            # The full rewrite includes anything still waiting to be logged
+            self._pending = []
+            self._dirty = False
+
+    def compact(self):
+        """Fold any pending or logged events back into the history file."""
+        with self._lock:
+            if self._dirty or self._uncompacted or os.path.exists(self.log_file):
+                self.save()
+
+    def close(self):
+        """Write everything out; call on shutdown."""
+        self.compact()
+
+    def flush(self):
+        """Append pending events to the log, compacting if enough have built up."""
+        with self._lock:
+            self._cancel_flush_timer()
+            if self._pending:
+                self._append_log(self._pending)
+                self._uncompacted += len(self._pending)
+                self._pending = []
+            self._dirty = False
+            self._last_flush = time.monotonic()
+            if self._uncompacted >= self.compact_every:
+                self.compact()
+
+    def _maybe_flush(self):
+        """Flush now if the last flush is old enough, otherwise make sure one is scheduled."""
+        elapsed = time.monotonic() - self._last_flush
+        if elapsed >= self.flush_interval:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval - elapsed, self.flush)
+            self._flush_timer.start()
+
+    def _cancel_flush_timer(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
 
     def add_event(self, save_event: SaveEvent):
         """Add a new save event to history."""
-        self.events.append(save_event.to_dict())
-        self._update_patterns()
-        self.save()
+        event = save_event.to_dict()
+        ts = self._parse_ts(event)
+        with self._lock:
+            self.events.append(event)
+            self._ts.append(ts)
+            self._accumulate(event)
+            self._track_break(len(self.events) - 1)
+            self._update_patterns()
+            self._trim()
+
+            self._pending.append(event)
+            self._dirty = True
+            self._maybe_flush()
 
     def _update_patterns(self):
         """Update learned patterns from event history."""
         if len(self.events) < 3:
             return
 
-        # Calculate average time between saves by type
-        autosave_intervals = []
-        manual_intervals = []
-
-        for event in self.events:
-            interval = event.get('time_since_last', 0)
-            if interval > 0:
-                if event.get('save_type') == 'autosave':
-                    autosave_intervals.append(interval)
-                elif event.get('save_type') == 'manual':
-                    manual_intervals.append(interval)
-
-        # Activity frequency
-        activities = Counter(e.get('inferred_activity', 'unknown') for e in self.events)
-
-        # Event type frequency
-        all_events = []
-        for save_event in self.events:
-            all_events.extend(save_event.get('events', []))
-        event_types = Counter(e.get('type', 'unknown') for e in all_events)
-
         self.patterns = {
-            'avg_autosave_interval': sum(autosave_intervals) / len(autosave_intervals) if autosave_intervals else 0,
-            'avg_manual_interval': sum(manual_intervals) / len(manual_intervals) if manual_intervals else 0,
-            'activity_distribution': dict(activities),
-            'event_type_distribution': dict(event_types),
+            'avg_autosave_interval': self._autosave_sum / self._autosave_n if self._autosave_n else 0,
+            'avg_manual_interval': self._manual_sum / self._manual_n if self._manual_n else 0,
+            # Unary + drops keys whose count fell to zero after trimming
+            'activity_distribution': dict(+self._activity_counter),
+            'event_type_distribution': dict(+self._event_type_counter),
             'total_saves': len(self.events),
         }
 
@@ -118,18 +373,10 @@ class SaveHistory:
         if not self.events:
             return None
 
-        # Find session boundaries (gaps > 30 min)
-        session_events = []
-        for event in reversed(self.events):
-            if session_events:
-                last_time = datetime.fromisoformat(session_events[-1]['timestamp'])
-                this_time = datetime.fromisoformat(event['timestamp'])
-                gap = (last_time - this_time).total_seconds()
-                if gap > 1800:  # 30 minutes
-                    break
-            session_events.append(event)
-
-        session_events.reverse()
+        # The current session starts at the most recent break (gap > 30 min)
+        session_start = self._break_indices[-1] if self._break_indices else 0
+        session_events = self.events[session_start:]
+        session_ts = [ts for ts in self._ts[session_start:] if ts is not None]
 
         if not session_events:
             return None
@@ -137,7 +384,7 @@ class SaveHistory:
         # Calculate summary
         start_time = session_events[0]['timestamp']
         end_time = session_events[-1]['timestamp']
-        duration = (datetime.fromisoformat(end_time) - datetime.fromisoformat(start_time)).total_seconds() / 60
+        duration = (session_ts[-1] - session_ts[0]) / 60 if session_ts else 0.0
 
         # Count events
         pals_caught = 0
@@ -180,11 +427,7 @@ class SaveHistory:
         if not self.events:
             return {'message': 'No history yet'}
 
-        total_events = []
-        for save_event in self.events:
-            total_events.extend(save_event.get('events', []))
-
-        event_counts = Counter(e.get('type') for e in total_events)
+        event_counts = self._event_type_counter
 
         return {
             'total_saves': len(self.events),
@@ -215,11 +458,7 @@ class SaveHistory:
             trends.append(f"You've been mostly {top_activity} lately ({count}/10 saves)")
 
         # Event trend
-        recent_events = []
-        for save_event in recent:
-            recent_events.extend(save_event.get('events', []))
-
-        event_counts = Counter(e.get('type') for e in recent_events)
+        event_counts = Counter(e.get('type') for save_event in recent for e in save_event.get('events', []))
         if event_counts.get('pal_caught', 0) >= 3:
             trends.append(f"Catching spree! {event_counts['pal_caught']} pals caught recently")
         if event_counts.get('pal_leveled', 0) >= 5:
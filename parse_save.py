@@ -6,40 +6,322 @@ Extracts player, pal, and world data from Level.sav files.
 
 import sys
 import os
-import re
+import struct
+import zlib
 import json
-from pathlib import Path
-from io import StringIO
+import functools
 
-# Suppress library debug output
+# Hyperscan is optional; when installed it counts all markers in one SIMD pass
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# GVAS property layout following the property name:
+#   FString type name ("StrProperty"), u64 payload size, u8 has-GUID flag,
+#   then the value as an FString (i32 length, then bytes incl. terminator;
+#   a negative length means UTF-16LE with -length code units).
+STR_PROPERTY_TYPE = b'\x0c\x00\x00\x00StrProperty\x00'
+STR_VALUE_OFFSET = len(STR_PROPERTY_TYPE) + 8 + 1
+# Anything longer is not a real player/guild name
+MAX_STR_LENGTH = 1024
+
+# Markers counted over the whole GVAS payload, keyed by result field
+COUNTED_MARKERS = (
+    ('pal_count', b'PalIndividualCharacterSaveParameter'),   # character/pal saves
+    ('work_entries', b'WorkSaveData'),                      # indicates active bases
+    ('item_container_count', b'ItemContainerSaveData'),    # items in storage
+)
+
+# Host typically has UID 00000000-0000-0000-0000-000000000001
+HOST_UID_PATTERN = rb'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01'  # Host UID in binary
+
+# Streaming: compressed bytes read per step, and decompressed bytes per piece
+GVAS_CHUNK_SIZE = 1024 * 1024
+# Bytes carried between pieces; must cover the longest name record
+# (property name + StrProperty header + MAX_STR_LENGTH UTF-16 code units)
+SCAN_OVERLAP = 4096
+
+
+_marker_db = None
+
+
+def _get_marker_db():
+    """Compile (once) a Hyperscan database matching every COUNTED_MARKERS needle, or None."""
+    global _marker_db
+    if _marker_db is None and hyperscan is not None:
+        try:
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(
+                # Hex-escape every byte: patterns are regexes and may not contain NULs
+                expressions=[b''.join(b'\\x%02x' % c for c in marker) for _, marker in COUNTED_MARKERS],
+                ids=list(range(len(COUNTED_MARKERS))),
+                elements=len(COUNTED_MARKERS),
+                flags=[0] * len(COUNTED_MARKERS),
+            )
+            _marker_db = db
+        except hyperscan.error:
+            # e.g. CPU without the required SIMD support; use bytes.count instead
+            _marker_db = False
+    return _marker_db or None
+
+
+def count_markers(buf, skip=0):
+    """
+    Count each COUNTED_MARKERS needle in buf, ignoring hits lying wholly
+    within the first `skip` bytes. Returns counts in COUNTED_MARKERS order.
+    """
+    if skip >= len(buf):
+        return [0] * len(COUNTED_MARKERS)
+
+    db = _get_marker_db()
+    if db is None:
+        return [buf.count(marker) - buf.count(marker, 0, skip) for _, marker in COUNTED_MARKERS]
+
+    counts = [0] * len(COUNTED_MARKERS)
+
+    def on_match(marker_id, start, end, flags, context):
+        if end > skip:
+            counts[marker_id] += 1
+
+    db.scan(buf, match_event_handler=on_match)
+    return counts
+
+
+# Suppress library debug output (discarded, not buffered in memory)
 class SuppressOutput:
     def __enter__(self):
         self._stdout = sys.stdout
         self._stderr = sys.stderr
-        sys.stdout = StringIO()
-        sys.stderr = StringIO()
+        self._devnull = open(os.devnull, 'w')
+        sys.stdout = self._devnull
+        sys.stderr = self._devnull
         return self
 
     def __exit__(self, *args):
         sys.stdout = self._stdout
         sys.stderr = self._stderr
+        self._devnull.close()
+
+def iter_str_properties(buf, prop_name, end=None):
+    """
+    Yield the decoded value of every StrProperty named prop_name in a GVAS buffer.
+    If end is given, only records whose name starts before end are read.
+    """
+    needle = prop_name + b'\x00'
+    idx = buf.find(needle)
+    while idx >= 0 and (end is None or idx < end):
+        idx += len(needle)
+        off = idx + STR_VALUE_OFFSET
+        if (buf.startswith(STR_PROPERTY_TYPE, idx)
+                and buf[off - 1:off] == b'\x00'  # no property GUID
+                and off + 4 <= len(buf)):
+            length, = struct.unpack_from('<i', buf, off)
+            off += 4
+            if 0 < length <= MAX_STR_LENGTH and buf[off + length - 1:off + length] == b'\x00':
+                yield buf[off:off + length - 1].decode('utf-8', errors='ignore')
+                idx = off + length
+            elif 0 < -length <= MAX_STR_LENGTH and buf[off - 2 * length - 2:off - 2 * length] == b'\x00\x00':
+                yield buf[off:off - 2 * length - 2].decode('utf-16-le', errors='ignore')
+                idx = off - 2 * length
+        idx = buf.find(needle, idx)
+
+
+class GvasScanner:
+    """
+    Collects the parse_level_sav fields from a GVAS payload fed in pieces.
+    The tail of each piece is carried into the next so markers and name
+    records that straddle a boundary are still seen exactly once.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.counts = {key: 0 for key, _ in COUNTED_MARKERS}
+        self.players = []
+        self.guild_name = None
+        self.has_host_uid = False
+        self._seen = set()
+        self._carry = b''
+
+    def feed(self, piece):
+        self.size += len(piece)
+        self._scan(self._carry + piece, final=False)
+
+    def close(self):
+        self._scan(self._carry, final=True)
+
+    def _scan(self, buf, final):
+        # Markers lying wholly inside the carry were counted last time
+        counts = count_markers(buf, skip=len(self._carry))
+        for (key, _), n in zip(COUNTED_MARKERS, counts):
+            self.counts[key] += n
+
+        # Name records starting in the carry are deferred to the next piece
+        cut = None if final else max(len(buf) - SCAN_OVERLAP, 0)
+        for name in iter_str_properties(buf, b'NickName', cut):
+            name = name.strip()
+            if name and len(name) > 2 and name not in self._seen:
+                self._seen.add(name)
+                self.players.append(name)
+        if self.guild_name is None:
+            # First non-blank value; like the old regex, empty names are skipped
+            names = (g.strip() for g in iter_str_properties(buf, b'GuildName', cut))
+            self.guild_name = next((g for g in names if g), None)
+
+        if not self.has_host_uid and HOST_UID_PATTERN in buf:
+            self.has_host_uid = True
+
+        self._carry = b'' if final else buf[cut:]
+
+
+def _inflate(decompressor, data):
+    """Feed data through a zlib decompressor, yielding at most GVAS_CHUNK_SIZE bytes at a time."""
+    while data:
+        piece = decompressor.decompress(data, GVAS_CHUNK_SIZE)
+        if piece:
+            yield piece
+        data = decompressor.unconsumed_tail
+
+
+def _iter_plz_pieces(f, double_zlib, uncompressed_len):
+    """Yield the GVAS payload of a zlib ('PlZ') save piece by piece."""
+    outer = zlib.decompressobj()
+    inner = zlib.decompressobj() if double_zlib else None
+    total = 0
+    for block in iter(lambda: f.read(GVAS_CHUNK_SIZE), b''):
+        for piece in _inflate(outer, block):
+            for out in (_inflate(inner, piece) if inner else (piece,)):
+                total += len(out)
+                yield out
+
+    tail = outer.flush()
+    if inner:
+        tail = b''.join(_inflate(inner, tail)) + inner.flush()
+    if tail:
+        total += len(tail)
+        yield tail
+
+    if total != uncompressed_len:
+        raise ValueError(f"Uncompressed length mismatch: {total} != {uncompressed_len}")
+
+
+def open_gvas_stream(f):
+    """
+    Return an iterator over the decompressed GVAS payload of an open save file,
+    or None if the format isn't plain zlib (e.g. Oodle) and needs
+    palworld-save-tools to decompress.
+    """
+    header = f.read(12)
+    if header[8:11] == b'CNK':
+        header = f.read(12)
+    # 0x31 = zlib, 0x32 = zlib inside zlib
+    if header[8:11] != b'PlZ' or header[11:12] not in (b'\x31', b'\x32'):
+        return None
+    uncompressed_len = int.from_bytes(header[0:4], byteorder='little')
+    return _iter_plz_pieces(f, header[11] == 0x32, uncompressed_len)
+
+
+# Parsed results are cached next to the save so repeat CLI runs skip decompression
+PARSED_CACHE_SUFFIX = '.parsed.json'
+# Bump whenever the parser's output changes, so stale sidecars are ignored
+PARSED_CACHE_VERSION = 2
+
+
+class _ParseFailed(Exception):
+    """Carries an error result out of _parse_cached, so lru_cache doesn't keep it."""
+
+    def __init__(self, result):
+        super().__init__(result.get('error'))
+        self.result = result
+
 
 def parse_level_sav(save_path):
-    """Parse a Level.sav file and return structured data."""
+    """
+    Parse a Level.sav file and return structured data.
+    Successful results are cached on (path, mtime, size), so an unchanged
+    save is only decompressed and scanned once. Failures (e.g. the game
+    holding the file locked) are retried on the next call.
+    """
+    if not os.path.exists(save_path):
+        return {"error": f"File not found: {save_path}"}
+
+    st = os.stat(save_path)
+    try:
+        result = _parse_cached(os.path.abspath(save_path), st.st_mtime_ns, st.st_size)
+    except _ParseFailed as e:
+        return e.result
+    # Copy so callers can't mutate the cached dict or its players list, and
+    # report the path as given
+    return dict(result, file=save_path, players=list(result['players']))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_cached(abs_path, mtime_ns, size):
+    """In-process cache in front of the on-disk sidecar and the real parser."""
+    cache_path = abs_path + PARSED_CACHE_SUFFIX
+    cached = _read_parsed_cache(cache_path, mtime_ns, size)
+    if cached is not None:
+        return cached
+
+    result = _parse_uncached(abs_path)
+    if not result.get('success'):
+        raise _ParseFailed(result)
+    _write_parsed_cache(cache_path, mtime_ns, size, result)
+    return result
+
+
+def _read_parsed_cache(cache_path, mtime_ns, size):
+    """Return the cached result if the sidecar matches this version of the save."""
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    if (cached.get('version') != PARSED_CACHE_VERSION
+            or cached.get('mtime_ns') != mtime_ns or cached.get('size') != size):
+        return None
+    return cached.get('result')
+
+
+def _write_parsed_cache(cache_path, mtime_ns, size, result):
+    """Best-effort write of the sidecar; a read-only save dir just means no cache."""
+    tmp_path = cache_path + '.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': PARSED_CACHE_VERSION, 'mtime_ns': mtime_ns, 'size': size,
+                       'result': result}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _parse_uncached(save_path):
+    """Decompress and scan a Level.sav file."""
     try:
         from palworld_save_tools.palsav import decompress_sav_to_gvas
     except ImportError:
         return {"error": "palworld-save-tools not installed"}
 
-    if not os.path.exists(save_path):
-        return {"error": f"File not found: {save_path}"}
-
+    scanner = GvasScanner()
     try:
         with open(save_path, 'rb') as f:
-            data = f.read()
-        # Suppress library debug output during decompression
-        with SuppressOutput():
-            raw_gvas, _ = decompress_sav_to_gvas(data)
+            # zlib saves are decompressed and scanned piece by piece, so the
+            # full payload is never held in memory at once
+            pieces = open_gvas_stream(f)
+            if pieces is not None:
+                for piece in pieces:
+                    scanner.feed(piece)
+            else:
+                data = f.read()
+                # Suppress library debug output during decompression
+                with SuppressOutput():
+                    raw_gvas, _ = decompress_sav_to_gvas(data)
+                del data
+                scanner.feed(raw_gvas)
+                del raw_gvas
+        scanner.close()
     except Exception as e:
         return {"error": f"Decompression failed: {str(e)}"}
 
@@ -57,52 +339,43 @@ def parse_level_sav(save_path):
         "file": save_path,
         "world_id": world_id,
         "file_size_kb": round(os.path.getsize(save_path) / 1024, 1),
-        "raw_size_mb": round(len(raw_gvas) / 1024 / 1024, 1),
-        "players": [],
-        "pal_count": 0,
-        "guild_name": None,
+        "raw_size_mb": round(scanner.size / 1024 / 1024, 1),
+        "players": scanner.players,
+        "pal_count": scanner.counts['pal_count'],
+        "guild_name": scanner.guild_name,
         "host_player": None,
+        "work_entries": scanner.counts['work_entries'],
+        "item_container_count": scanner.counts['item_container_count'],
     }
 
-    # Extract player names
-    player_pattern = rb'NickName\x00\x0c\x00\x00\x00StrProperty\x00[\x00-\xff]{4}\x00\x00\x00\x00\x00[\x00-\xff]{4}([\x20-\x7e]+)\x00'
-    for m in re.finditer(player_pattern, raw_gvas):
-        try:
-            name = m.group(1).decode('utf-8', errors='ignore').strip()
-            if name and len(name) > 2 and name not in result['players']:
-                result['players'].append(name)
-        except:
-            pass
-
     # Try to detect host player by looking for PlayerUId pattern
-    # Host typically has UID 00000000-0000-0000-0000-000000000001
     # Look for IsPlayer=True followed by PlayerUId with the host pattern
-    host_uid_pattern = rb'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01'  # Host UID in binary
-    if host_uid_pattern in raw_gvas:
+    if scanner.has_host_uid:
         # If host UID found and we have players, first player is often the host
         # Note: This is a heuristic - the full snapshot.py parser is more accurate
         if result['players']:
             result['host_player'] = result['players'][0]
 
-    # Count character/pal saves
-    result['pal_count'] = raw_gvas.count(b'PalIndividualCharacterSaveParameter')
-
-    # Extract guild name
-    guild_pattern = rb'GuildName\x00\x0c\x00\x00\x00StrProperty\x00[\x00-\xff]{4}\x00\x00\x00\x00\x00[\x00-\xff]{4}([\x20-\x7e]+)\x00'
-    guild_match = re.search(guild_pattern, raw_gvas)
-    if guild_match:
-        try:
-            result['guild_name'] = guild_match.group(1).decode('utf-8', errors='ignore').strip()
-        except:
-            pass
-
-    # Count bases (look for WorkSaveData which indicates active bases)
-    result['work_entries'] = raw_gvas.count(b'WorkSaveData')
+    return result
 
-    # Count items in storage
-    result['item_container_count'] = raw_gvas.count(b'ItemContainerSaveData')
 
-    return result
+def find_level_savs(root):
+    """
+    Yield (path, mtime) for every Level.sav under root, one stat per file.
+    Like Path.rglob, directory symlinks are not followed.
+    """
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_level_savs(entry.path)
+            elif entry.name == 'Level.sav':
+                yield entry.path, entry.stat(follow_symlinks=False).st_mtime
+        except OSError:
+            continue
 
 
 def main():
@@ -112,12 +385,12 @@ def main():
             '~/AppData/Local/Pal/Saved/SaveGames'
         )
         # Find most recent Level.sav
-        level_files = list(Path(save_path).rglob('Level.sav'))
+        level_files = list(find_level_savs(save_path))
         if not level_files:
             print(json.dumps({"error": "No Level.sav files found"}))
             return
         # Get most recently modified
-        save_path = str(max(level_files, key=lambda p: p.stat().st_mtime))
+        save_path = max(level_files, key=lambda x: x[1])[0]
     else:
         save_path = sys.argv[1]
 
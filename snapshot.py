@@ -5,17 +5,41 @@ Extracts structured data from Palworld saves and detects changes between snapsho
 """
 
 import json
+import mmap
 import os
+import sys
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from palworld_save_tools.palsav import decompress_sav_to_gvas
 from palworld_save_tools.gvas import GvasFile
-from palworld_save_tools.paltypes import PALWORLD_CUSTOM_PROPERTIES
+from palworld_save_tools.paltypes import PALWORLD_CUSTOM_PROPERTIES, PALWORLD_TYPE_HINTS
 
+from parse_save import SuppressOutput
 
-@dataclass
+# orjson is optional; it parses the (often huge) save JSON several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pysimdjson is optional; pre-parsed JSON saves are then read lazily, so only
+# the fields create_snapshot touches are turned into Python objects
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Object node types extract_value unwraps: plain dicts, plus lazy simdjson objects
+_OBJECT_TYPES = (dict,) if simdjson is None else (dict, simdjson.Object)
+
+
+@dataclass(slots=True)
 class SaveEvent:
     """Metadata about a save event for pattern learning."""
     timestamp: str
@@ -62,14 +86,14 @@ class SaveEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     uid: str
     name: str
     level: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Pal:
     instance_id: str
     species: str
@@ -84,14 +108,14 @@ class Pal:
     nickname: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Base:
     id: str
     name: str
     # Add more fields as we discover them
 
 
-@dataclass
+@dataclass(slots=True)
 class Snapshot:
     timestamp: str
     file_path: str
@@ -102,9 +126,38 @@ class Snapshot:
     game_time: Optional[int] = None
     world_id: Optional[str] = None
     host_player: Optional[str] = None
+    # Lookup indexes, built on first use. Snapshots are treated as immutable
+    # once created, so the monitor's next diff against this one reuses them.
+    _pals_by_id: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _players_by_uid: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def pals_by_id(self) -> dict:
+        if self._pals_by_id is None:
+            self._pals_by_id = {p['instance_id']: p for p in self.pals if p['instance_id']}
+        return self._pals_by_id
+
+    @property
+    def players_by_uid(self) -> dict:
+        if self._players_by_uid is None:
+            self._players_by_uid = {p['uid']: p for p in self.players if p['uid']}
+        return self._players_by_uid
 
     def to_dict(self):
-        return asdict(self)
+        # Built by hand rather than with asdict(), which deep-copies every
+        # player and pal dict; callers only serialize the result. The lookup
+        # indexes are left out.
+        return {
+            'timestamp': self.timestamp,
+            'file_path': self.file_path,
+            'players': self.players,
+            'pals': self.pals,
+            'bases': self.bases,
+            'pal_count': self.pal_count,
+            'game_time': self.game_time,
+            'world_id': self.world_id,
+            'host_player': self.host_player,
+        }
 
     @classmethod
     def from_dict(cls, d):
@@ -113,15 +166,26 @@ class Snapshot:
 
 def extract_value(obj, default=None):
     """Safely extract value from nested Palworld save structures."""
-    if obj is None:
-        return default
-    if isinstance(obj, dict):
-        if 'value' in obj:
-            return extract_value(obj['value'], default)
-        return obj
+    while isinstance(obj, _OBJECT_TYPES) and 'value' in obj:
+        obj = obj['value']
+    return default if obj is None else obj
+
+
+def materialize(obj):
+    """Convert a lazy simdjson node into plain dicts/lists; other values pass through."""
+    if simdjson is not None:
+        if isinstance(obj, simdjson.Object):
+            return obj.as_dict()
+        if isinstance(obj, simdjson.Array):
+            return obj.as_list()
     return obj
 
 
+# Host UID with dashes stripped. It has no hex letters, so comparing needs no
+# case folding: a UID with letters in either case can't match it anyway.
+_HOST_UID = '00000000000000000000000000000001'
+
+
 def is_host_uid(uid: str) -> bool:
     """
     Check if a player UID indicates they are the world host.
@@ -129,9 +193,7 @@ def is_host_uid(uid: str) -> bool:
     """
     if not uid:
         return False
-    # Normalize and check for host pattern
-    uid_clean = uid.lower().replace('-', '')
-    return uid_clean == '00000000000000000000000000000001'
+    return uid.replace('-', '') == _HOST_UID
 
 
 def extract_world_id(file_path: str) -> Optional[str]:
@@ -151,56 +213,97 @@ def extract_world_id(file_path: str) -> Optional[str]:
     return None
 
 
-def parse_save_to_json(save_path: str) -> dict:
-    """Parse a save file to JSON structure using CLI tool."""
-    import subprocess
-    import tempfile
+def read_json_file(path: str) -> dict:
+    """
+    Load a JSON file, using orjson when it's installed.
+    orjson parses straight from a read-only mmap of the file, so the raw
+    bytes are paged in from the page cache instead of copied onto the heap.
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                try:
+                    return orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    # orjson rejects NaN/Infinity literals, which stdlib json accepts
+                    return json.loads(view.tobytes())
+    with open(path, 'r') as f:
+        return json.load(f)
 
-    # Use the CLI tool which handles parsing better
-    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp:
-        tmp_path = tmp.name
 
-    try:
-        result = subprocess.run(
-            ['palworld-save-tools', '--to-json', '--convert-nan-to-null', '--force', '-o', tmp_path, save_path],
-            capture_output=True,
-            text=True,
-            timeout=300,
-            input='y\n'  # Auto-confirm any prompts
-        )
+def parse_save_to_gvas_dict(save_path: str) -> dict:
+    """
+    Parse a save file in-process into the same structure that
+    `palworld-save-tools --to-json` writes, without the JSON roundtrip.
+    """
+    with open(save_path, 'rb') as f:
+        data = f.read()
+    with SuppressOutput():
+        raw_gvas, _ = decompress_sav_to_gvas(data)
+    del data
 
-        if result.returncode != 0:
-            raise Exception(f"Failed to parse save: {result.stderr}")
+    with SuppressOutput():
+        gvas = GvasFile.read(raw_gvas, PALWORLD_TYPE_HINTS, PALWORLD_CUSTOM_PROPERTIES, allow_nan=True)
+    del raw_gvas
+    return gvas.dump()
 
-        with open(tmp_path, 'r') as f:
-            return json.load(f)
-    finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
 
+# Older name, from when this shelled out to the CLI and loaded its JSON output
+parse_save_to_json = parse_save_to_gvas_dict
 
-def load_json_save(json_path: str) -> dict:
-    """Load a pre-parsed JSON save file."""
-    with open(json_path, 'r') as f:
-        return json.load(f)
+
+def load_json_save(json_path: str):
+    """
+    Load a pre-parsed JSON save file.
+    With pysimdjson installed this returns a lazy document instead of a dict;
+    create_snapshot reads either.
+    """
+    if simdjson is not None:
+        with open(json_path, 'rb') as f:
+            data = f.read()
+        try:
+            return simdjson.Parser().parse(data)
+        except ValueError:
+            # e.g. NaN literals, which only the json fallback accepts
+            pass
+    return read_json_file(json_path)
+
+
+def _intern(value):
+    """
+    Intern a string that repeats across pals (species, gender, owner), so a
+    snapshot holds one copy of each instead of one per pal.
+    Anything other than a str (e.g. from a corrupted entry) is returned as-is.
+    """
+    return sys.intern(value) if type(value) is str else value
 
 
 def create_snapshot(save_path: str, json_data: dict = None) -> Snapshot:
     """Create a snapshot from a save file or pre-parsed JSON."""
     if json_data is None:
-        json_data = parse_save_to_json(save_path)
+        json_data = parse_save_to_gvas_dict(save_path)
 
     world = json_data['properties']['worldSaveData']['value']
 
     # Extract players and pals
     players = []
     pals = []
+    host_player = None  # Name of the first player with the host UID
 
     chars = world.get('CharacterSaveParameterMap', {}).get('value', [])
 
+    # Hot loop (one pass per character in the world): bind globals and
+    # bound methods to locals once instead of looking them up per field
+    ev = extract_value
+    intern = _intern
+    add_player = players.append
+    add_pal = pals.append
+
     for char in chars:
         key = char.get('key', {})
-        instance_id = extract_value(key.get('InstanceId'))
+        instance_id = ev(key.get('InstanceId'))
 
         raw_data = char.get('value', {}).get('RawData', {}).get('value', {})
         obj = raw_data.get('object', {}).get('SaveParameter', {}).get('value', {})
@@ -208,35 +311,40 @@ def create_snapshot(save_path: str, json_data: dict = None) -> Snapshot:
         if not obj:
             continue
 
-        is_player = extract_value(obj.get('IsPlayer'), False)
+        get = obj.get
+        is_player = ev(get('IsPlayer'), False)
 
         if is_player:
-            uid = str(extract_value(key.get('PlayerUId'), ''))
-            players.append({
+            uid = str(ev(key.get('PlayerUId'), ''))
+            name = ev(get('NickName'), 'Unknown')
+            is_host = is_host_uid(uid)
+            add_player({
                 'uid': uid,
-                'name': extract_value(obj.get('NickName'), 'Unknown'),
-                'level': extract_value(obj.get('Level'), 0),
-                'is_host': is_host_uid(uid),
+                'name': name,
+                'level': ev(get('Level'), 0),
+                'is_host': is_host,
             })
+            if is_host and host_player is None:
+                host_player = name
         else:
-            species = extract_value(obj.get('CharacterID'), 'Unknown')
+            species = ev(get('CharacterID'), 'Unknown')
 
             # Skip if no species (corrupted entry)
             if species == 'Unknown' or not species:
                 continue
 
-            pals.append({
+            add_pal({
                 'instance_id': str(instance_id) if instance_id else '',
-                'species': species,
-                'level': extract_value(obj.get('Level'), 0),
-                'exp': extract_value(obj.get('Exp'), 0),
-                'hp_iv': extract_value(obj.get('Talent_HP'), 0),
-                'def_iv': extract_value(obj.get('Talent_Defense'), 0),
-                'atk_iv': extract_value(obj.get('Talent_Shot'), 0),
-                'gender': extract_value(obj.get('Gender'), 'Unknown'),
-                'passives': extract_value(obj.get('PassiveSkillList'), []),
-                'owner_uid': str(extract_value(obj.get('OwnerPlayerUId'), '')),
-                'nickname': extract_value(obj.get('NickName')),
+                'species': intern(species),
+                'level': ev(get('Level'), 0),
+                'exp': ev(get('Exp'), 0),
+                'hp_iv': ev(get('Talent_HP'), 0),
+                'def_iv': ev(get('Talent_Defense'), 0),
+                'atk_iv': ev(get('Talent_Shot'), 0),
+                'gender': intern(ev(get('Gender'), 'Unknown')),
+                'passives': materialize(ev(get('PassiveSkillList'), [])),
+                'owner_uid': intern(str(ev(get('OwnerPlayerUId'), ''))),
+                'nickname': ev(get('NickName')),
             })
 
     # Extract bases
@@ -255,13 +363,6 @@ def create_snapshot(save_path: str, json_data: dict = None) -> Snapshot:
     # Extract world ID from path
     world_id = extract_world_id(save_path)
 
-    # Find host player
-    host_player = None
-    for p in players:
-        if p.get('is_host'):
-            host_player = p['name']
-            break
-
     return Snapshot(
         timestamp=datetime.now().isoformat(),
         file_path=save_path,
@@ -275,7 +376,37 @@ def create_snapshot(save_path: str, json_data: dict = None) -> Snapshot:
     )
 
 
-@dataclass
+class SaveParserPool:
+    """
+    Long-lived worker processes for turning saves into snapshots.
+    Workers keep palworld_save_tools imported between saves, and separate
+    saves (e.g. one per world) are parsed in parallel. Each worker returns
+    the finished Snapshot rather than the parsed save, which is far larger
+    and slow to pickle back to the parent.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    def submit(self, save_path: str) -> Future:
+        """Queue a save for parsing; the Future resolves to its Snapshot."""
+        return self._executor.submit(create_snapshot, save_path)
+
+    def map(self, save_paths):
+        """Parse several saves in parallel, yielding Snapshots in input order."""
+        return self._executor.map(create_snapshot, save_paths)
+
+    def close(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@dataclass(slots=True)
 class Event:
     """Represents a detected change between snapshots."""
     type: str       # 'pal_caught', 'pal_released', 'pal_leveled', 'player_joined', etc.
@@ -285,93 +416,109 @@ class Event:
     message: str    # Human-readable description
 
 
-def diff_snapshots(old: Snapshot, new: Snapshot) -> list:
-    """Compare two snapshots and return list of Events."""
-    events = []
+# Sort keys for events and event dicts; these run in C, unlike a lambda
+_PRIORITY_KEY = attrgetter('priority')
+_PRIORITY_DICT_KEY = itemgetter('priority')
+
+
+def _event_dict(event_type: str, category: str, data, priority: int, message: str) -> dict:
+    """Serializable form of an Event, as stored in SaveEvent.events (without data)."""
+    return {'type': event_type, 'category': category, 'message': message, 'priority': priority}
+
+
+def _event(event_type: str, category: str, data, priority: int, message: str) -> Event:
+    """Event with the same call signature as _event_dict."""
+    return Event(event_type, category, data, priority, message)
 
-    # Index old data for quick lookup
-    old_pals = {p['instance_id']: p for p in old.pals if p['instance_id']}
-    new_pals = {p['instance_id']: p for p in new.pals if p['instance_id']}
-    old_players = {p['uid']: p for p in old.players if p['uid']}
-    new_players = {p['uid']: p for p in new.players if p['uid']}
 
-    # Check for new pals (caught)
+def diff_snapshots(old: Snapshot, new: Snapshot, as_dict: bool = False) -> list:
+    """
+    Compare two snapshots and return list of Events.
+    With as_dict=True, returns the serializable event dicts stored on
+    SaveEvent instead, without building Event objects first.
+    """
+    events = []
+    make = _event_dict if as_dict else _event
+    # Event dicts drop data, so don't build the payloads that only exist for it
+    keep_data = not as_dict
+
+    # Indexes are memoized on the snapshots, so the monitor only builds them
+    # once per snapshot rather than once per diff
+    old_pals = old.pals_by_id
+    new_pals = new.pals_by_id
+    old_players = old.players_by_uid
+    new_players = new.players_by_uid
+
+    # One pass over the new pals finds both catches and level ups; the pass
+    # over the old pals only has to find releases
     for pid, pal in new_pals.items():
-        if pid not in old_pals:
+        old_pal = old_pals.get(pid)
+        if old_pal is None:
             total_iv = pal['hp_iv'] + pal['def_iv'] + pal['atk_iv']
-            events.append(Event(
-                type='pal_caught',
+            events.append(make(
+                event_type='pal_caught',
                 category='pal',
                 data=pal,
                 priority=1 if total_iv >= 200 else 2,
                 message=f"Caught {pal['species']} Lv.{pal['level']} (IVs: {pal['hp_iv']}/{pal['def_iv']}/{pal['atk_iv']} = {total_iv})"
             ))
+        elif pal['level'] > old_pal['level']:
+            events.append(make(
+                event_type='pal_leveled',
+                category='pal',
+                data={'old': old_pal, 'new': pal} if keep_data else None,
+                priority=3,
+                message=f"{pal['species']} leveled up: {old_pal['level']} -> {pal['level']}"
+            ))
 
     # Check for released/lost pals
     for pid, pal in old_pals.items():
         if pid not in new_pals:
-            events.append(Event(
-                type='pal_released',
+            events.append(make(
+                event_type='pal_released',
                 category='pal',
                 data=pal,
                 priority=2,
                 message=f"Released/Lost {pal['species']} Lv.{pal['level']}"
             ))
 
-    # Check for pal level ups
-    for pid, new_pal in new_pals.items():
-        if pid in old_pals:
-            old_pal = old_pals[pid]
-            if new_pal['level'] > old_pal['level']:
-                events.append(Event(
-                    type='pal_leveled',
-                    category='pal',
-                    data={'old': old_pal, 'new': new_pal},
-                    priority=3,
-                    message=f"{new_pal['species']} leveled up: {old_pal['level']} -> {new_pal['level']}"
-                ))
-
-    # Check for new players
+    # Same for players: joins and level ups, then departures
     for uid, player in new_players.items():
-        if uid not in old_players:
-            events.append(Event(
-                type='player_joined',
+        old_player = old_players.get(uid)
+        if old_player is None:
+            events.append(make(
+                event_type='player_joined',
                 category='player',
                 data=player,
                 priority=1,
                 message=f"{player['name']} joined the world (Lv.{player['level']})"
             ))
+        elif player['level'] > old_player['level']:
+            events.append(make(
+                event_type='player_leveled',
+                category='player',
+                data={'old': old_player, 'new': player} if keep_data else None,
+                priority=2,
+                message=f"{player['name']} leveled up: {old_player['level']} -> {player['level']}"
+            ))
 
     # Check for players who left
     for uid, player in old_players.items():
         if uid not in new_players:
-            events.append(Event(
-                type='player_left',
+            events.append(make(
+                event_type='player_left',
                 category='player',
                 data=player,
                 priority=1,
                 message=f"{player['name']} left the world"
             ))
 
-    # Check for player level ups
-    for uid, new_player in new_players.items():
-        if uid in old_players:
-            old_player = old_players[uid]
-            if new_player['level'] > old_player['level']:
-                events.append(Event(
-                    type='player_leveled',
-                    category='player',
-                    data={'old': old_player, 'new': new_player},
-                    priority=2,
-                    message=f"{new_player['name']} leveled up: {old_player['level']} -> {new_player['level']}"
-                ))
-
     # Check for new bases
     if len(new.bases) > len(old.bases):
-        events.append(Event(
-            type='base_created',
+        events.append(make(
+            event_type='base_created',
             category='base',
-            data={'count': len(new.bases)},
+            data={'count': len(new.bases)} if keep_data else None,
             priority=1,
             message=f"New base established! Total bases: {len(new.bases)}"
         ))
@@ -379,16 +526,16 @@ def diff_snapshots(old: Snapshot, new: Snapshot) -> list:
     # Pal count summary (if significant change)
     pal_diff = new.pal_count - old.pal_count
     if abs(pal_diff) >= 5:
-        events.append(Event(
-            type='pal_count_change',
+        events.append(make(
+            event_type='pal_count_change',
             category='world',
-            data={'old': old.pal_count, 'new': new.pal_count, 'diff': pal_diff},
+            data={'old': old.pal_count, 'new': new.pal_count, 'diff': pal_diff} if keep_data else None,
             priority=3,
             message=f"Pal count: {old.pal_count} -> {new.pal_count} ({'+' if pal_diff > 0 else ''}{pal_diff})"
         ))
 
     # Sort by priority
-    events.sort(key=lambda e: e.priority)
+    events.sort(key=_PRIORITY_DICT_KEY if as_dict else _PRIORITY_KEY)
 
     return events
 
@@ -426,14 +573,13 @@ def infer_activity(events: list) -> str:
     if not events:
         return 'idle'
 
-    event_types = [e.type if hasattr(e, 'type') else e.get('type') for e in events]
-
     # Count event types
-    level_ups = sum(1 for t in event_types if t == 'pal_leveled')
-    catches = sum(1 for t in event_types if t == 'pal_caught')
-    releases = sum(1 for t in event_types if t == 'pal_released')
-    base_events = sum(1 for t in event_types if t == 'base_created')
-    player_levels = sum(1 for t in event_types if t == 'player_leveled')
+    counts = Counter(e.type if hasattr(e, 'type') else e.get('type') for e in events)
+    level_ups = counts['pal_leveled']
+    catches = counts['pal_caught']
+    releases = counts['pal_released']
+    base_events = counts['base_created']
+    player_levels = counts['player_leveled']
 
     # Determine primary activity
     if catches >= 2:
@@ -449,29 +595,65 @@ def infer_activity(events: list) -> str:
     if releases >= 1 and catches == 0:
         return 'managing'  # Releasing pals, organizing
 
-    # Check for breeding (new pals with high IVs might indicate breeding)
-    for e in events:
-        if hasattr(e, 'type'):
-            if e.type == 'pal_caught':
-                data = e.data
-        else:
-            if e.get('type') == 'pal_caught':
-                data = e.get('data', {})
-        # Could check for breeding indicators here
-
     return 'exploring'  # Default: just playing around
 
 
+@lru_cache(maxsize=256)
+def _parse_iso(ts: str) -> datetime:
+    """
+    Parse an ISO timestamp. Memoized: each snapshot's timestamp is parsed
+    again as the previous timestamp of the next save event.
+    """
+    return datetime.fromisoformat(ts)
+
+
+class SnapshotCache:
+    """
+    The most recent snapshots, keyed by timestamp, so a long-running watcher
+    can diff against the previous save without reloading it from disk.
+    Kept small: a snapshot of a large world is tens of MB.
+    """
+
+    def __init__(self, size: int = 4):
+        if size < 1:
+            raise ValueError(f"SnapshotCache size must be at least 1, got {size}")
+        self._snapshots = {}
+        self._order = deque(maxlen=size)
+
+    def put(self, snapshot: Snapshot):
+        ts = snapshot.timestamp
+        if ts not in self._snapshots:
+            if len(self._order) == self._order.maxlen:
+                # Appending below pushes the oldest timestamp out of the ring
+                del self._snapshots[self._order[0]]
+            self._order.append(ts)
+        self._snapshots[ts] = snapshot
+
+    def get(self, timestamp: str) -> Optional[Snapshot]:
+        return self._snapshots.get(timestamp)
+
+    def __len__(self):
+        return len(self._snapshots)
+
+
 def create_save_event(
     current_snapshot: Snapshot,
     previous_snapshot: Optional[Snapshot],
     file_path: str,
     previous_file_size: int = 0,
-    previous_timestamp: str = None
+    previous_timestamp: str = None,
+    cache: Optional[SnapshotCache] = None
 ) -> SaveEvent:
     """
     Create a SaveEvent by comparing current snapshot to previous.
+    With a cache, a missing previous_snapshot is looked up by
+    previous_timestamp, and the current snapshot is added for the next call.
     """
+    if cache is not None:
+        if previous_snapshot is None and previous_timestamp:
+            previous_snapshot = cache.get(previous_timestamp)
+        cache.put(current_snapshot)
+
     # Get file info
     file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
 
@@ -479,19 +661,17 @@ def create_save_event(
     time_since_last = 0.0
     if previous_timestamp:
         try:
-            prev_dt = datetime.fromisoformat(previous_timestamp)
-            curr_dt = datetime.fromisoformat(current_snapshot.timestamp)
+            prev_dt = _parse_iso(previous_timestamp)
+            curr_dt = _parse_iso(current_snapshot.timestamp)
             time_since_last = (curr_dt - prev_dt).total_seconds()
-        except:
+        except (TypeError, ValueError):
+            # Malformed or non-string timestamp, e.g. from an old history file
             pass
 
     # Get events from diff
     events = []
     if previous_snapshot:
-        event_objs = diff_snapshots(previous_snapshot, current_snapshot)
-        # Convert Event objects to dicts for serialization
-        events = [{'type': e.type, 'category': e.category, 'message': e.message, 'priority': e.priority}
-                  for e in event_objs]
+        events = diff_snapshots(previous_snapshot, current_snapshot, as_dict=True)
 
     # Classify and infer
     save_type = classify_save_type(time_since_last)
@@ -510,16 +690,40 @@ def create_save_event(
     )
 
 
-def save_snapshot(snapshot: Snapshot, path: str):
-    """Save snapshot to JSON file."""
+def save_snapshot(snapshot: Snapshot, path: str, pretty: bool = False):
+    """Save snapshot to JSON file (compact unless pretty=True)."""
+    data = snapshot.to_dict()
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
     with open(path, 'w') as f:
-        json.dump(snapshot.to_dict(), f, indent=2, default=str)
+        if pretty:
+            json.dump(data, f, indent=2, default=str)
+        else:
+            json.dump(data, f, separators=(',', ':'), default=str)
 
 
 def load_snapshot(path: str) -> Snapshot:
     """Load snapshot from JSON file."""
-    with open(path, 'r') as f:
-        return Snapshot.from_dict(json.load(f))
+    return Snapshot.from_dict(read_json_file(path))
+
+
+def save_snapshot_msgpack(snapshot: Snapshot, path: str):
+    """
+    Save snapshot as MessagePack: smaller than JSON and faster to load back.
+    Requires the msgpack package.
+    """
+    import msgpack
+    with open(path, 'wb') as f:
+        f.write(msgpack.packb(snapshot.to_dict(), use_bin_type=True, default=str))
+
+
+def load_snapshot_msgpack(path: str) -> Snapshot:
+    """Load snapshot from a file written by save_snapshot_msgpack."""
+    import msgpack
+    with open(path, 'rb') as f:
+        return Snapshot.from_dict(msgpack.unpackb(f.read(), raw=False))
 
 
 # CLI for testing